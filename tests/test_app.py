@@ -2,106 +2,109 @@
 FastAPI tests for Mergington High School Activities API
 """
 
-import pytest
-from fastapi.testclient import TestClient
-import sys
-from pathlib import Path
+from types import MappingProxyType
 
-# Add src directory to path to import app
-sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
+import pytest
+from httpx import ASGITransport, AsyncClient
 
+# src/ is on the import path via pytest.ini's pythonpath setting
 from app import app, activities
 
+# Read-only initial activity data, copied into `activities` before each test
+_ORIGINAL_ACTIVITIES = MappingProxyType({
+    "Chess Club": MappingProxyType({
+        "description": "Learn strategies and compete in chess tournaments",
+        "schedule": "Fridays, 3:30 PM - 5:00 PM",
+        "max_participants": 12,
+        "participants": ("michael@mergington.edu", "daniel@mergington.edu")
+    }),
+    "Programming Class": MappingProxyType({
+        "description": "Learn programming fundamentals and build software projects",
+        "schedule": "Tuesdays and Thursdays, 3:30 PM - 4:30 PM",
+        "max_participants": 20,
+        "participants": ("emma@mergington.edu", "sophia@mergington.edu")
+    }),
+    "Gym Class": MappingProxyType({
+        "description": "Physical education and sports activities",
+        "schedule": "Mondays, Wednesdays, Fridays, 2:00 PM - 3:00 PM",
+        "max_participants": 30,
+        "participants": ("john@mergington.edu", "olivia@mergington.edu")
+    }),
+    "Basketball Team": MappingProxyType({
+        "description": "Competitive basketball team and training",
+        "schedule": "Tuesdays and Thursdays, 4:00 PM - 5:30 PM",
+        "max_participants": 15,
+        "participants": ("alex@mergington.edu",)
+    }),
+    "Tennis Club": MappingProxyType({
+        "description": "Learn tennis skills and participate in friendly matches",
+        "schedule": "Wednesdays and Saturdays, 3:00 PM - 4:30 PM",
+        "max_participants": 10,
+        "participants": ("sarah@mergington.edu", "james@mergington.edu")
+    }),
+    "Art Studio": MappingProxyType({
+        "description": "Explore painting, drawing, and mixed media techniques",
+        "schedule": "Mondays and Wednesdays, 3:30 PM - 5:00 PM",
+        "max_participants": 18,
+        "participants": ("isabella@mergington.edu",)
+    }),
+    "Music Ensemble": MappingProxyType({
+        "description": "Join our student orchestra and perform in concerts",
+        "schedule": "Thursdays, 3:30 PM - 5:00 PM",
+        "max_participants": 25,
+        "participants": ("lucas@mergington.edu", "mia@mergington.edu")
+    }),
+    "Debate Club": MappingProxyType({
+        "description": "Develop argumentation skills and compete in debate competitions",
+        "schedule": "Fridays, 4:00 PM - 5:30 PM",
+        "max_participants": 16,
+        "participants": ("noah@mergington.edu",)
+    }),
+    "Science Club": MappingProxyType({
+        "description": "Conduct experiments and explore STEM topics",
+        "schedule": "Mondays and Fridays, 3:45 PM - 5:00 PM",
+        "max_participants": 22,
+        "participants": ("ava@mergington.edu", "ethan@mergington.edu")
+    })
+})
+
+# Activity names for parametrized tests; httpx percent-encodes them in paths
+ACTIVITIES = list(_ORIGINAL_ACTIVITIES)
 
-@pytest.fixture
-def client():
-    """Create a test client for the FastAPI app"""
-    return TestClient(app)
 
+@pytest.fixture(scope="session")
+async def client():
+    """Create a single async test client for the FastAPI app, shared by all tests"""
+    transport = ASGITransport(app=app)
+    async with AsyncClient(transport=transport, base_url="http://test") as ac:
+        yield ac
 
-@pytest.fixture
+
+@pytest.fixture(autouse=True)
 def reset_activities():
     """Reset activities to initial state before each test"""
-    original_activities = {
-        "Chess Club": {
-            "description": "Learn strategies and compete in chess tournaments",
-            "schedule": "Fridays, 3:30 PM - 5:00 PM",
-            "max_participants": 12,
-            "participants": ["michael@mergington.edu", "daniel@mergington.edu"]
-        },
-        "Programming Class": {
-            "description": "Learn programming fundamentals and build software projects",
-            "schedule": "Tuesdays and Thursdays, 3:30 PM - 4:30 PM",
-            "max_participants": 20,
-            "participants": ["emma@mergington.edu", "sophia@mergington.edu"]
-        },
-        "Gym Class": {
-            "description": "Physical education and sports activities",
-            "schedule": "Mondays, Wednesdays, Fridays, 2:00 PM - 3:00 PM",
-            "max_participants": 30,
-            "participants": ["john@mergington.edu", "olivia@mergington.edu"]
-        },
-        "Basketball Team": {
-            "description": "Competitive basketball team and training",
-            "schedule": "Tuesdays and Thursdays, 4:00 PM - 5:30 PM",
-            "max_participants": 15,
-            "participants": ["alex@mergington.edu"]
-        },
-        "Tennis Club": {
-            "description": "Learn tennis skills and participate in friendly matches",
-            "schedule": "Wednesdays and Saturdays, 3:00 PM - 4:30 PM",
-            "max_participants": 10,
-            "participants": ["sarah@mergington.edu", "james@mergington.edu"]
-        },
-        "Art Studio": {
-            "description": "Explore painting, drawing, and mixed media techniques",
-            "schedule": "Mondays and Wednesdays, 3:30 PM - 5:00 PM",
-            "max_participants": 18,
-            "participants": ["isabella@mergington.edu"]
-        },
-        "Music Ensemble": {
-            "description": "Join our student orchestra and perform in concerts",
-            "schedule": "Thursdays, 3:30 PM - 5:00 PM",
-            "max_participants": 25,
-            "participants": ["lucas@mergington.edu", "mia@mergington.edu"]
-        },
-        "Debate Club": {
-            "description": "Develop argumentation skills and compete in debate competitions",
-            "schedule": "Fridays, 4:00 PM - 5:30 PM",
-            "max_participants": 16,
-            "participants": ["noah@mergington.edu"]
-        },
-        "Science Club": {
-            "description": "Conduct experiments and explore STEM topics",
-            "schedule": "Mondays and Fridays, 3:45 PM - 5:00 PM",
-            "max_participants": 22,
-            "participants": ["ava@mergington.edu", "ethan@mergington.edu"]
-        }
-    }
-    
-    # Clear and repopulate activities
-    activities.clear()
-    activities.update(original_activities)
-    yield
-    
-    # Cleanup after test
+    # Clear and repopulate activities; the next test's reset makes a
+    # teardown reset unnecessary
     activities.clear()
-    activities.update(original_activities)
+    activities.update({
+        name: {**details, "participants": list(details["participants"])}
+        for name, details in _ORIGINAL_ACTIVITIES.items()
+    })
 
 
 class TestGetActivities:
-    def test_get_activities_returns_all_activities(self, client, reset_activities):
+    async def test_get_activities_returns_all_activities(self, client):
         """Test that GET /activities returns all activities"""
-        response = client.get("/activities")
+        response = await client.get("/activities")
         assert response.status_code == 200
         data = response.json()
         assert len(data) == 9
         assert "Chess Club" in data
         assert "Programming Class" in data
 
-    def test_activity_structure(self, client, reset_activities):
+    async def test_activity_structure(self, client):
         """Test that activities have correct structure"""
-        response = client.get("/activities")
+        response = await client.get("/activities")
         data = response.json()
         chess_club = data["Chess Club"]
         
@@ -111,193 +114,187 @@ class TestGetActivities:
         assert "participants" in chess_club
         assert isinstance(chess_club["participants"], list)
 
-    def test_participants_data(self, client, reset_activities):
+    async def test_participants_data(self, client):
         """Test that participants are correctly returned"""
-        response = client.get("/activities")
+        response = await client.get("/activities")
         data = response.json()
         chess_club = data["Chess Club"]
         
         assert len(chess_club["participants"]) == 2
-        assert "michael@mergington.edu" in chess_club["participants"]
-        assert "daniel@mergington.edu" in chess_club["participants"]
+        participants = set(chess_club["participants"])
+        assert "michael@mergington.edu" in participants
+        assert "daniel@mergington.edu" in participants
 
 
 class TestSignup:
-    def test_signup_for_activity_success(self, client, reset_activities):
+    @pytest.mark.parametrize("name", ACTIVITIES)
+    async def test_signup_for_activity_success(self, client, name):
         """Test successful signup for an activity"""
-        response = client.post(
-            "/activities/Chess%20Club/signup?email=newstudent@mergington.edu",
-            follow_redirects=True
+        response = await client.post(
+            f"/activities/{name}/signup",
+            params={"email": "newstudent@mergington.edu"}
         )
         assert response.status_code == 200
         data = response.json()
         assert "Signed up" in data["message"]
         
         # Verify participant was added
-        activities_response = client.get("/activities")
-        activities_data = activities_response.json()
-        assert "newstudent@mergington.edu" in activities_data["Chess Club"]["participants"]
+        assert "newstudent@mergington.edu" in activities[name]["participants"]
 
-    def test_signup_duplicate_student(self, client, reset_activities):
+    async def test_signup_duplicate_student(self, client):
         """Test that duplicate signups are rejected"""
-        response = client.post(
-            "/activities/Chess%20Club/signup?email=michael@mergington.edu",
-            follow_redirects=True
+        response = await client.post(
+            "/activities/Chess Club/signup",
+            params={"email": "michael@mergington.edu"}
         )
         assert response.status_code == 400
-        data = response.json()
-        assert "already signed up" in data["detail"]
+        detail = response.json()["detail"]
+        assert "already signed up" in detail
 
-    def test_signup_nonexistent_activity(self, client, reset_activities):
+    async def test_signup_nonexistent_activity(self, client):
         """Test signup for non-existent activity"""
-        response = client.post(
-            "/activities/Fake%20Activity/signup?email=newstudent@mergington.edu",
-            follow_redirects=True
+        response = await client.post(
+            "/activities/Fake Activity/signup",
+            params={"email": "newstudent@mergington.edu"}
         )
         assert response.status_code == 404
-        data = response.json()
-        assert "not found" in data["detail"]
+        detail = response.json()["detail"]
+        assert "not found" in detail
 
-    def test_signup_updates_participant_count(self, client, reset_activities):
+    async def test_signup_updates_participant_count(self, client):
         """Test that signup updates participant list"""
         # Get initial count
-        initial_response = client.get("/activities")
+        initial_response = await client.get("/activities")
         initial_count = len(initial_response.json()["Programming Class"]["participants"])
         
         # Signup
-        client.post(
-            "/activities/Programming%20Class/signup?email=testuser@mergington.edu",
-            follow_redirects=True
+        await client.post(
+            "/activities/Programming Class/signup",
+            params={"email": "testuser@mergington.edu"}
         )
         
         # Check new count
-        updated_response = client.get("/activities")
-        new_count = len(updated_response.json()["Programming Class"]["participants"])
+        new_count = len(activities["Programming Class"]["participants"])
         
         assert new_count == initial_count + 1
 
 
 class TestUnregister:
-    def test_unregister_success(self, client, reset_activities):
+    @pytest.mark.parametrize("name", ACTIVITIES)
+    async def test_unregister_success(self, client, name):
         """Test successful unregister from activity"""
-        response = client.post(
-            "/activities/Chess%20Club/unregister?email=michael@mergington.edu",
-            follow_redirects=True
+        email = _ORIGINAL_ACTIVITIES[name]["participants"][0]
+        response = await client.post(
+            f"/activities/{name}/unregister",
+            params={"email": email}
         )
         assert response.status_code == 200
         data = response.json()
         assert "Removed" in data["message"]
         
         # Verify participant was removed
-        activities_response = client.get("/activities")
-        activities_data = activities_response.json()
-        assert "michael@mergington.edu" not in activities_data["Chess Club"]["participants"]
+        assert email not in activities[name]["participants"]
 
-    def test_unregister_not_registered(self, client, reset_activities):
+    async def test_unregister_not_registered(self, client):
         """Test unregister for student not registered"""
-        response = client.post(
-            "/activities/Chess%20Club/unregister?email=nonexistent@mergington.edu",
-            follow_redirects=True
+        response = await client.post(
+            "/activities/Chess Club/unregister",
+            params={"email": "nonexistent@mergington.edu"}
         )
         assert response.status_code == 400
-        data = response.json()
-        assert "not registered" in data["detail"]
+        detail = response.json()["detail"]
+        assert "not registered" in detail
 
-    def test_unregister_nonexistent_activity(self, client, reset_activities):
+    async def test_unregister_nonexistent_activity(self, client):
         """Test unregister from non-existent activity"""
-        response = client.post(
-            "/activities/Fake%20Activity/unregister?email=michael@mergington.edu",
-            follow_redirects=True
+        response = await client.post(
+            "/activities/Fake Activity/unregister",
+            params={"email": "michael@mergington.edu"}
         )
         assert response.status_code == 404
-        data = response.json()
-        assert "not found" in data["detail"]
+        detail = response.json()["detail"]
+        assert "not found" in detail
 
-    def test_unregister_reduces_participant_count(self, client, reset_activities):
+    async def test_unregister_reduces_participant_count(self, client):
         """Test that unregister reduces participant count"""
         # Get initial count
-        initial_response = client.get("/activities")
+        initial_response = await client.get("/activities")
         initial_count = len(initial_response.json()["Chess Club"]["participants"])
         
         # Unregister
-        client.post(
-            "/activities/Chess%20Club/unregister?email=michael@mergington.edu",
-            follow_redirects=True
+        await client.post(
+            "/activities/Chess Club/unregister",
+            params={"email": "michael@mergington.edu"}
         )
         
         # Check new count
-        updated_response = client.get("/activities")
-        new_count = len(updated_response.json()["Chess Club"]["participants"])
+        new_count = len(activities["Chess Club"]["participants"])
         
         assert new_count == initial_count - 1
 
 
 class TestIntegration:
-    def test_signup_then_unregister_flow(self, client, reset_activities):
+    async def test_signup_then_unregister_flow(self, client):
         """Test complete flow of signup and then unregister"""
         email = "integration@mergington.edu"
-        activity = "Basketball%20Team"
+        activity = "Basketball Team"
         
         # Initial state
-        response = client.get("/activities")
+        response = await client.get("/activities")
         initial = len(response.json()["Basketball Team"]["participants"])
         
         # Sign up
-        signup_response = client.post(
-            f"/activities/{activity}/signup?email={email}",
-            follow_redirects=True
+        signup_response = await client.post(
+            f"/activities/{activity}/signup",
+            params={"email": email}
         )
         assert signup_response.status_code == 200
         
         # Check increased count
-        response = client.get("/activities")
-        after_signup = len(response.json()["Basketball Team"]["participants"])
+        after_signup = len(activities["Basketball Team"]["participants"])
         assert after_signup == initial + 1
         
         # Unregister
-        unregister_response = client.post(
-            f"/activities/{activity}/unregister?email={email}",
-            follow_redirects=True
+        unregister_response = await client.post(
+            f"/activities/{activity}/unregister",
+            params={"email": email}
         )
         assert unregister_response.status_code == 200
         
         # Check back to initial count
-        response = client.get("/activities")
-        final = len(response.json()["Basketball Team"]["participants"])
+        final = len(activities["Basketball Team"]["participants"])
         assert final == initial
 
-    def test_multiple_signups_and_unregisters(self, client, reset_activities):
+    async def test_multiple_signups_and_unregisters(self, client):
         """Test multiple students signing up and unregistering"""
-        activity = "Tennis%20Club"
+        activity = "Tennis Club"
         students = ["student1@mergington.edu", "student2@mergington.edu", "student3@mergington.edu"]
         
         # Initial count
-        response = client.get("/activities")
+        response = await client.get("/activities")
         initial_count = len(response.json()["Tennis Club"]["participants"])
         
         # All sign up
         for student in students:
-            response = client.post(
-                f"/activities/{activity}/signup?email={student}",
-                follow_redirects=True
+            response = await client.post(
+                f"/activities/{activity}/signup",
+                params={"email": student}
             )
             assert response.status_code == 200
         
         # Check all are added
-        response = client.get("/activities")
-        current_count = len(response.json()["Tennis Club"]["participants"])
+        current_count = len(activities["Tennis Club"]["participants"])
         assert current_count == initial_count + 3
         
         # Unregister first two
         for student in students[:2]:
-            response = client.post(
-                f"/activities/{activity}/unregister?email={student}",
-                follow_redirects=True
+            response = await client.post(
+                f"/activities/{activity}/unregister",
+                params={"email": student}
             )
             assert response.status_code == 200
         
         # Check count decreased
-        response = client.get("/activities")
-        final_count = len(response.json()["Tennis Club"]["participants"])
+        final_count = len(activities["Tennis Club"]["participants"])
         assert final_count == initial_count + 1
-        assert students[2] in response.json()["Tennis Club"]["participants"]
+        assert students[2] in activities["Tennis Club"]["participants"]